@@ -25,26 +25,131 @@ Configuration via environment variables:
     SKIP_GIT            - Set to "1" to skip git commit/push
     ARCHIVE_CUTOFF_YEAR - Filter data_all.json to this year and later
     ENABLE_PI_HEALTH    - Set to "1" to write Pi health telemetry
+    HEARTBEAT_MINUTES   - Max minutes between history rows when listener
+                          counts are unchanged (default: 60)
+    EXTRA_MOUNT_FIELDS  - Set to "1" to also extract per-mount metadata
+                          (description, bitrate, genre, ...)
+    PUSH_INTERVAL_MINUTES - Minimum minutes between git pushes; commits
+                          accumulate locally in between (default: 0)
 """
 
 import os
 import re
 import csv
 import json
-import time
+import shlex
+import hashlib
+import threading
 import subprocess
-from datetime import datetime, timedelta, timezone
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
 import shutil
 from typing import List, Tuple, Dict, Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# The HTML fallback parsers (selectolax / lxml / BeautifulSoup) are only
+# needed when status-json.xsl is unavailable, so probe which are installed
+# without importing them; the JSON happy path never pays their import cost
+HAS_SELECTOLAX = find_spec("selectolax") is not None
+HAS_LXML = find_spec("lxml") is not None
+HAS_BS4 = find_spec("bs4") is not None
+if not (HAS_SELECTOLAX or HAS_LXML or HAS_BS4):
+    print("[info] No HTML parser available, JSON-only mode")
+
+BeautifulSoup = None
+LexborHTMLParser = None
+lxml_html = None
+_XP_TABLES = _XP_HEADERS = _XP_ROWS = _XP_CELLS = None
+_html_parsers_loaded = False
+
+def _load_html_parsers() -> None:
+    """Import the installed HTML fallback parsers on first actual use."""
+    global _html_parsers_loaded, BeautifulSoup, LexborHTMLParser, lxml_html
+    global HAS_SELECTOLAX, HAS_LXML, HAS_BS4
+    global _XP_TABLES, _XP_HEADERS, _XP_ROWS, _XP_CELLS
+    if _html_parsers_loaded:
+        return
+    _html_parsers_loaded = True
+
+    # selectolax (lexbor) first: C-backed tree, fastest of the three
+    if HAS_SELECTOLAX:
+        try:
+            from selectolax.lexbor import LexborHTMLParser as _Lexbor
+            LexborHTMLParser = _Lexbor
+        except ImportError:
+            HAS_SELECTOLAX = False
+
+    # lxml next: compiled XPath beats BeautifulSoup's Python-level
+    # wrappers over the same lxml tree
+    if HAS_LXML:
+        try:
+            import lxml.html as _lxml_html
+            from lxml import etree
+            lxml_html = _lxml_html
+            _XP_TABLES = etree.XPath("//table")
+            _XP_HEADERS = etree.XPath(".//th")
+            _XP_ROWS = etree.XPath(".//tr")
+            _XP_CELLS = etree.XPath("./td|./th")
+        except ImportError:
+            HAS_LXML = False
+
+    # BeautifulSoup stays as the fallback's fallback
+    if HAS_BS4:
+        try:
+            from bs4 import BeautifulSoup as _BS
+            BeautifulSoup = _BS
+        except ImportError:
+            HAS_BS4 = False
+
+# Try to import orjson for fast C-level JSON encode/decode
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    print("[info] orjson not available, using stdlib json")
+
+# Try to import pysimdjson for lazy SIMD parsing of the Icecast status JSON.
+# Parsers are kept per thread: simdjson.Parser is not thread-safe and each
+# parse() invalidates the previous document's lazy proxies, so the fetch
+# workers must never share one. Reuse within a thread still avoids per-call
+# slab allocation; mount sources are indexed lazily so unused fields never
+# become Python objects.
+try:
+    import simdjson
+    _simd_local = threading.local()
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
+def _simd_parse(content: bytes) -> Any:
+    """Parse bytes with this thread's own reusable simdjson parser."""
+    parser = getattr(_simd_local, "parser", None)
+    if parser is None:
+        parser = _simd_local.parser = simdjson.Parser()
+    return parser.parse(content)
+
+# Try to import numpy so per-series points are packed (N, 2) int64
+# arrays instead of lists of Python tuples (~4x less memory, vectorized
+# timestamp filtering)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-# Try to import BeautifulSoup for HTML fallback parsing
+# Try to import pandas so the ever-growing history CSV is parsed by its
+# C engine instead of a per-row/per-cell Python loop
 try:
-    from bs4 import BeautifulSoup
-    HAS_BS4 = True
+    import pandas as pd
+    HAS_PANDAS = True
 except ImportError:
-    HAS_BS4 = False
-    print("[info] BeautifulSoup not available, JSON-only mode")
+    HAS_PANDAS = False
 
 # --------------------------- Configuration ---------------------------
 
@@ -80,31 +185,159 @@ REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 SITE_DATA_DIR = os.path.join(REPO_ROOT, "data")
 HISTORY_CSV = os.path.join(REPO_ROOT, "scraper", "history.csv")
 
+# Sidecar cache of HTTP validators (ETag/Last-Modified) per status URL,
+# so unchanged status pages come back as an empty 304 instead of a full body
+ETAG_CACHE_PATH = os.path.join(REPO_ROOT, "scraper", ".etag_cache.json")
+
 # Time window for 24h view
 WINDOW_HOURS = int(os.getenv("WINDOW_HOURS", "24"))
 
 # Git options
 SKIP_GIT = os.getenv("SKIP_GIT", "0") == "1"
 
+# Minimum minutes between git pushes. Commits still happen every tick
+# (nothing is lost), but pushes are coalesced: the next allowed push
+# carries all commits accumulated since the last one. 0 = push every run.
+PUSH_INTERVAL_MS = int(os.getenv("PUSH_INTERVAL_MINUTES", "0")) * 60 * 1000
+PUSH_STAMP_PATH = os.path.join(REPO_ROOT, "scraper", ".last_push")
+
 # Archive cutoff year (filter data_all to only include this year and later)
 ARCHIVE_CUTOFF_YEAR = os.getenv("ARCHIVE_CUTOFF_YEAR")
 
 # Pi health telemetry
 ENABLE_PI_HEALTH = os.getenv("ENABLE_PI_HEALTH", "0") == "1"
 
+# When listener counts are unchanged the row append is skipped, but a
+# heartbeat row is still recorded at least this often (minutes)
+HEARTBEAT_INTERVAL_MS = int(os.getenv("HEARTBEAT_MINUTES", "60")) * 60 * 1000
+
+# Per-mount metadata beyond listeners/peak/title is unused downstream;
+# only extract it when explicitly asked to
+EXTRA_MOUNT_FIELDS = os.getenv("EXTRA_MOUNT_FIELDS", "0") == "1"
+
 # Archive directories
 ARCHIVE_MONTHLY_DIR = os.path.join(SITE_DATA_DIR, "monthly")
 ARCHIVE_YEARLY_DIR = os.path.join(SITE_DATA_DIR, "yearly")
 
+# Sidecar stamp recording the last-written data_all.json fingerprint
+DATA_ALL_STAMP = os.path.join(SITE_DATA_DIR, ".data_all.stamp")
+
+# Precompiled patterns; these run every tick (telemetry) or per table
+# cell (HTML fallback), so compile once at import instead of per call.
+_RE_MEMINFO = re.compile(rb"^(MemTotal|MemAvailable):\s+(\d+)", re.MULTILINE)
+
+_RE_TEMP = re.compile(r"temp=([0-9.]+)")
+_RE_NON_DIGITS = re.compile(r"[^0-9]")
+
+# Fast-path patterns for the stock status.xsl layout, matched against the
+# raw response bytes (no decode, no DOM) before any HTML parser runs
+_RE_FAST_MOUNT = re.compile(rb"^\s*(/[^\s<]+)")
+_RE_FAST_LISTENERS = re.compile(rb"Listeners \(current\):</td>\s*<td[^>]*>(\d+)")
+_RE_FAST_PEAK = re.compile(rb"Listeners \(peak\):</td>\s*<td[^>]*>(\d+)")
+
+# --------------------------- HTTP Session ---------------------------
+
+# Shared session so the JSON attempt and the HTML fallback against the same
+# server reuse one TCP/TLS connection instead of re-handshaking, and so
+# transient Icecast hiccups are retried without a separate retry layer.
+_session = requests.Session()
+_session.headers["User-Agent"] = "NopherosListenerScraper/2.0"
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3,
+                      status_forcelist=[502, 503, 504])
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 # --------------------------- Helpers ---------------------------
 
 def iso_now() -> str:
     """Get current time as ISO 8601 string."""
     return datetime.now(timezone.utc).isoformat()
 
-def ts_now_ms() -> int:
-    """Get current time as Unix timestamp in milliseconds."""
-    return int(time.time() * 1000)
+# The scraper is a one-shot cron process, so "now" is constant for the
+# whole run: read the clock once and share it across every fetched_at,
+# generated_at and history timestamp
+RUN_DT = datetime.now(timezone.utc)
+RUN_ISO = RUN_DT.isoformat()
+RUN_MS = int(RUN_DT.timestamp() * 1000)
+
+def _json_default(obj: Any) -> Any:
+    """stdlib-json fallback for numpy arrays/scalars in payloads."""
+    tolist = getattr(obj, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if HAS_NUMPY:
+            option |= orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+def json_loads_bytes(data: bytes) -> Any:
+    """Parse JSON from bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Write bytes to a path atomically (temp file + os.replace), so readers
+    never observe a truncated or half-written file if the script is killed
+    mid-write (OOM, power loss — both real risks on a Pi).
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _dirty_dirs.add(os.path.dirname(path) or ".")
+
+# Directories with renamed-in files this run; fsynced once in a batch at
+# the end instead of per write (directory fsync is what makes the rename
+# itself durable, and one sync per directory is enough)
+_dirty_dirs: set = set()
+
+def flush_write_dirs() -> None:
+    """fsync each directory touched by atomic writes this run."""
+    for d in _dirty_dirs:
+        try:
+            fd = os.open(d, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+    _dirty_dirs.clear()
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """
+    Atomically write data only when it differs from the previous run.
+
+    A sibling .sha stamp keeps the last content hash, so byte-identical
+    outputs skip the write, the SD-card wear, and the later git add.
+    Returns True when the file was actually (re)written.
+    """
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    stamp = path + ".sha"
+    try:
+        with open(stamp, "r", encoding="utf-8") as f:
+            if f.read().strip() == digest:
+                return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    with open(stamp, "w", encoding="utf-8") as f:
+        f.write(digest)
+    return True
 
 def safe_int(value: Any, default: Optional[int] = None) -> Optional[int]:
     """Safely parse an integer."""
@@ -117,6 +350,56 @@ def safe_int(value: Any, default: Optional[int] = None) -> Optional[int]:
 
 # --------------------------- Icecast Parsing ---------------------------
 
+def _load_etag_cache() -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(ETAG_CACHE_PATH, "rb") as f:
+            cache = json_loads_bytes(f.read())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+_etag_cache = _load_etag_cache()
+_etag_cache_dirty = False
+
+def save_etag_cache() -> None:
+    """Persist validators + parsed payloads for the next run's 304s."""
+    if _etag_cache_dirty:
+        atomic_write_bytes(ETAG_CACHE_PATH, json_dumps_bytes(_etag_cache))
+
+def _conditional_get(url: str):
+    """
+    GET a status page with If-None-Match/If-Modified-Since from the
+    sidecar cache. Returns (response, cached_payload); cached_payload is
+    the previous run's parsed result when the server answers 304, in
+    which case no body was transferred or parsed at all.
+    """
+    entry = _etag_cache.get(url) or {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = _session.get(url, timeout=15, headers=headers or None)
+    if response.status_code == 304 and entry.get("payload") is not None:
+        return response, entry["payload"]
+    response.raise_for_status()
+    return response, None
+
+def _remember_validators(url: str, response, payload: Dict[str, Any]) -> None:
+    """Cache the response's validators alongside the parsed payload."""
+    global _etag_cache_dirty
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        return  # Server sends no validators; nothing to condition on
+    _etag_cache[url] = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "payload": payload
+    }
+    _etag_cache_dirty = True
+
 def fetch_icecast_status_json(base_url: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch and parse Icecast status-json.xsl endpoint.
@@ -130,12 +413,11 @@ def fetch_icecast_status_json(base_url: Optional[str] = None) -> Optional[Dict[s
     url = f"{server_url}/status-json.xsl"
 
     try:
-        response = requests.get(
-            url,
-            timeout=15,
-            headers={"User-Agent": "NopherosListenerScraper/2.0"}
-        )
-        response.raise_for_status()
+        response, cached = _conditional_get(url)
+        if cached is not None:
+            cached = dict(cached)
+            cached["fetched_at"] = RUN_ISO
+            return cached
 
         # Check content type
         content_type = response.headers.get("Content-Type", "")
@@ -143,20 +425,32 @@ def fetch_icecast_status_json(base_url: Optional[str] = None) -> Optional[Dict[s
             print(f"[warn] Unexpected content type from {server_url}: {content_type}")
             # Try parsing anyway
 
-        data = response.json()
-        return parse_icecast_json(data)
+        # Parse from raw bytes, skipping requests' own json module.
+        # simdjson hands back lazy proxies; parse_mount_source only ever
+        # touches the handful of keys it needs, so the rest of the payload
+        # is never materialized.
+        if HAS_SIMDJSON:
+            data = _simd_parse(response.content)
+        else:
+            data = json_loads_bytes(response.content)
+        parsed = parse_icecast_json(data)
+        if parsed is not None:
+            _remember_validators(url, response, parsed)
+        return parsed
 
     except requests.RequestException as e:
         print(f"[warn] Failed to fetch Icecast JSON status from {server_url}: {e}")
         return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"[warn] Failed to parse Icecast JSON from {server_url}: {e}")
         return None
 
-def parse_icecast_json(data: Dict[str, Any]) -> Dict[str, Any]:
+def parse_icecast_json(data: Any) -> Dict[str, Any]:
     """
     Parse Icecast status-json.xsl response.
 
+    Accepts either a plain dict or a lazy simdjson document proxy.
+
     Handles varying Icecast configurations where source may be:
     - A single object
     - An array of objects
@@ -167,7 +461,7 @@ def parse_icecast_json(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     result = {
         "mounts": {},
-        "fetched_at": iso_now()
+        "fetched_at": RUN_ISO
     }
 
     try:
@@ -177,11 +471,14 @@ def parse_icecast_json(data: Dict[str, Any]) -> Dict[str, Any]:
         if sources is None:
             return result
 
-        # Normalize to list
-        if isinstance(sources, dict):
+        # Normalize to list (duck-typed: simdjson proxies are not dict/list)
+        if hasattr(sources, "keys"):
             sources = [sources]
-        elif not isinstance(sources, list):
-            return result
+        else:
+            try:
+                sources = list(sources)
+            except TypeError:
+                return result
 
         for source in sources:
             mount_info = parse_mount_source(source)
@@ -193,54 +490,58 @@ def parse_icecast_json(data: Dict[str, Any]) -> Dict[str, Any]:
 
     return result
 
-def parse_mount_source(source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def parse_mount_source(source: Any) -> Optional[Dict[str, Any]]:
     """
     Parse a single mount source object from Icecast.
 
+    Accepts a plain dict or a lazy simdjson object proxy; only the needed
+    keys are read, so lazy proxies never materialize the full source.
+
     Extracts:
     - mountpoint (path only, e.g., /stream)
     - listeners (current count)
     - listener_peak (peak count, may not exist in all configs)
     - title (now playing metadata)
+
+    Further metadata (description, bitrate, genre, stream_start,
+    connected) is only extracted when EXTRA_MOUNT_FIELDS=1 — nothing
+    downstream reads it, so the default hot path skips the work.
     """
-    if not source or not isinstance(source, dict):
+    if source is None or not hasattr(source, "get"):
         return None
 
     try:
-        # Extract mountpoint from listenurl
-        mountpoint = None
-        listenurl = source.get("listenurl")
+        # Resolve the bound .get once instead of per key (the proxy's
+        # attribute lookup is the repeated cost here, not the access)
+        get = source.get
 
-        if listenurl:
-            # listenurl is typically "http://host:port/mountpoint"
-            try:
-                from urllib.parse import urlparse
-                parsed = urlparse(listenurl)
-                mountpoint = parsed.path
-            except Exception:
-                # Fallback: extract path manually
-                match = re.search(r"(/[^/]+)$", listenurl)
-                if match:
-                    mountpoint = match.group(1)
+        # Extract mountpoint from listenurl
+        # listenurl is typically "http://host:port/mountpoint"
+        listenurl = get("listenurl")
+        mountpoint = urlsplit(listenurl).path if listenurl else None
 
         if not mountpoint:
-            mountpoint = source.get("mount")
+            mountpoint = get("mount")
 
         if not mountpoint:
             return None
 
-        return {
+        info = {
             "mountpoint": mountpoint,
-            "listeners": safe_int(source.get("listeners"), 0),
-            "listener_peak": safe_int(source.get("listener_peak")),
-            "title": source.get("title") or source.get("yp_currently_playing"),
-            "description": source.get("server_description"),
-            "bitrate": safe_int(source.get("bitrate")),
-            "genre": source.get("genre"),
-            "stream_start": source.get("stream_start_iso8601"),
-            "connected": safe_int(source.get("connected"))
+            "listeners": safe_int(get("listeners"), 0),
+            "listener_peak": safe_int(get("listener_peak")),
+            "title": get("title") or get("yp_currently_playing")
         }
 
+        if EXTRA_MOUNT_FIELDS:
+            info["description"] = get("server_description")
+            info["bitrate"] = safe_int(get("bitrate"))
+            info["genre"] = get("genre")
+            info["stream_start"] = get("stream_start_iso8601")
+            info["connected"] = safe_int(get("connected"))
+
+        return info
+
     except Exception as e:
         print(f"[warn] Error parsing mount source: {e}")
         return None
@@ -253,99 +554,193 @@ def fetch_icecast_status_html(base_url: Optional[str] = None) -> Optional[Dict[s
     Args:
         base_url: Base URL of the Icecast server (defaults to ICECAST_BASE_URL)
     """
-    if not HAS_BS4:
+    if not (HAS_SELECTOLAX or HAS_LXML or HAS_BS4):
         return None
 
     server_url = base_url or ICECAST_BASE_URL
     url = f"{server_url}/status.xsl"
 
     try:
-        response = requests.get(
-            url,
-            timeout=15,
-            headers={"User-Agent": "NopherosListenerScraper/2.0"}
-        )
-        response.raise_for_status()
-
-        return parse_icecast_html(response.text)
+        response, cached = _conditional_get(url)
+        if cached is not None:
+            cached = dict(cached)
+            cached["fetched_at"] = RUN_ISO
+            return cached
+
+        # The stock status.xsl layout can be scraped with a few regex
+        # scans over the raw bytes; only build a DOM when that misses
+        fast = parse_icecast_html_fast(response.content)
+        if fast is not None:
+            _remember_validators(url, response, fast)
+            return fast
+
+        parsed = parse_icecast_html(response.text)
+        if parsed is not None:
+            _remember_validators(url, response, parsed)
+        return parsed
 
     except requests.RequestException as e:
         print(f"[warn] Failed to fetch Icecast HTML status from {server_url}: {e}")
         return None
 
+def parse_icecast_html_fast(content: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Regex fast-path for the stock Icecast status.xsl page.
+
+    Splits the raw bytes on the "Mount Point" headers and pulls the
+    current/peak listener counts out of each block. Returns None when
+    nothing matches (customized template), letting the DOM parsers take
+    over.
+    """
+    mounts: Dict[str, Any] = {}
+
+    for block in content.split(b"Mount Point")[1:]:
+        mount_m = _RE_FAST_MOUNT.match(block)
+        listeners_m = _RE_FAST_LISTENERS.search(block)
+        if not mount_m or not listeners_m:
+            continue
+
+        mount = mount_m.group(1).decode("utf-8", "replace")
+        peak_m = _RE_FAST_PEAK.search(block)
+
+        mounts[mount] = {
+            "mountpoint": mount,
+            "listeners": safe_int(listeners_m.group(1), 0),
+            "listener_peak": safe_int(peak_m.group(1)) if peak_m else None,
+            "title": None
+        }
+
+    if not mounts:
+        return None
+
+    return {"mounts": mounts, "fetched_at": RUN_ISO}
+
 def parse_icecast_html(html: str) -> Dict[str, Any]:
     """
     Parse Icecast status.xsl HTML page.
     Returns similar structure to JSON parser.
+
+    Uses selectolax's lexbor engine when available (C-backed parse and
+    traversal, no Python-level DOM); falls back to BeautifulSoup.
     """
     result = {
         "mounts": {},
-        "fetched_at": iso_now()
+        "fetched_at": RUN_ISO
     }
 
-    if not HAS_BS4:
-        return result
-
     try:
-        soup = BeautifulSoup(html, "lxml")
+        _load_html_parsers()
+        if HAS_SELECTOLAX:
+            tables = LexborHTMLParser(html).css("table")
+            extract = _extract_table_selectolax
+        elif HAS_LXML:
+            tables = _XP_TABLES(lxml_html.fromstring(html))
+            extract = _extract_table_lxml
+        elif HAS_BS4:
+            tables = BeautifulSoup(html, "lxml").find_all("table")
+            extract = _extract_table_bs4
+        else:
+            return result
+
+        if len(tables) > 1:
+            # This is already the slow path; overlap per-table traversal
+            # across workers (the C engines release the GIL while walking)
+            with ThreadPoolExecutor(max_workers=min(4, len(tables))) as ex:
+                for mounts in ex.map(extract, tables):
+                    result["mounts"].update(mounts)
+        elif tables:
+            result["mounts"].update(extract(tables[0]))
+
+    except Exception as e:
+        print(f"[warn] Error parsing Icecast HTML: {e}")
+
+    return result
 
-        # Look for tables with mount/listeners info
-        tables = soup.find_all("table")
-        for table in tables:
-            headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
+def _extract_table_selectolax(table) -> Dict[str, Any]:
+    """Pull header and cell texts from one selectolax table node."""
+    headers = [th.text(strip=True).lower() for th in table.css("th")]
+    cell_rows = [
+        [cell.text(strip=True) for cell in tr.css("td, th")]
+        for tr in table.css("tr")
+    ]
+    return parse_status_table(headers, cell_rows)
+
+def _extract_table_lxml(table) -> Dict[str, Any]:
+    """Pull header and cell texts from one lxml table element."""
+    headers = [th.text_content().strip().lower() for th in _XP_HEADERS(table)]
+    cell_rows = [
+        [cell.text_content().strip() for cell in _XP_CELLS(tr)]
+        for tr in _XP_ROWS(table)
+    ]
+    return parse_status_table(headers, cell_rows)
+
+def _extract_table_bs4(table) -> Dict[str, Any]:
+    """Pull header and cell texts from one BeautifulSoup table node."""
+    headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
+    cell_rows = [
+        [cell.get_text(strip=True) for cell in tr.find_all(["td", "th"])]
+        for tr in table.find_all("tr")
+    ]
+    return parse_status_table(headers, cell_rows)
+
+def parse_status_table(headers: List[str], cell_rows: List[List[str]]) -> Dict[str, Any]:
+    """
+    Extract mount/listener info from one status table's text cells.
 
-            if not headers:
-                continue
+    Backend-agnostic: callers hand over lowercased header texts and the
+    stripped cell texts per row, regardless of which HTML parser made them.
+    """
+    mounts: Dict[str, Any] = {}
 
-            # Find relevant column indices
-            idx_mount = None
-            idx_listeners = None
-            idx_peak = None
+    if not headers:
+        return mounts
 
-            for i, h in enumerate(headers):
-                if "mount" in h:
-                    idx_mount = i
-                elif h == "listeners":
-                    idx_listeners = i
-                elif "peak" in h:
-                    idx_peak = i
+    # Find relevant column indices
+    idx_mount = None
+    idx_listeners = None
+    idx_peak = None
 
-            if idx_mount is None or idx_listeners is None:
-                continue
+    for i, h in enumerate(headers):
+        if "mount" in h:
+            idx_mount = i
+        elif h == "listeners":
+            idx_listeners = i
+        elif "peak" in h:
+            idx_peak = i
 
-            # Parse rows
-            for tr in table.find_all("tr"):
-                cells = [td.get_text(strip=True) for td in tr.find_all(["td", "th"])]
+    if idx_mount is None or idx_listeners is None:
+        return mounts
 
-                if len(cells) <= max(idx_mount, idx_listeners):
-                    continue
+    # Hoisted out of the row loop: the minimum usable cell count
+    min_cells = max(idx_mount, idx_listeners) + 1
 
-                mount = cells[idx_mount]
-                if not mount or mount.lower() == "mount point":
-                    continue
+    for cells in cell_rows:
+        if len(cells) < min_cells:
+            continue
 
-                # Ensure mount starts with /
-                if not mount.startswith("/"):
-                    mount = "/" + mount
+        mount = cells[idx_mount]
+        if not mount or mount.lower() == "mount point":
+            continue
 
-                listeners_str = cells[idx_listeners]
-                listeners = safe_int(re.sub(r"[^0-9]", "", listeners_str), 0)
+        # Ensure mount starts with /
+        if not mount.startswith("/"):
+            mount = "/" + mount
 
-                peak = None
-                if idx_peak is not None and len(cells) > idx_peak:
-                    peak = safe_int(re.sub(r"[^0-9]", "", cells[idx_peak]))
+        listeners_str = cells[idx_listeners]
+        listeners = safe_int(_RE_NON_DIGITS.sub("", listeners_str), 0)
 
-                result["mounts"][mount] = {
-                    "mountpoint": mount,
-                    "listeners": listeners,
-                    "listener_peak": peak,
-                    "title": None
-                }
+        peak = None
+        if idx_peak is not None and len(cells) > idx_peak:
+            peak = safe_int(_RE_NON_DIGITS.sub("", cells[idx_peak]))
 
-    except Exception as e:
-        print(f"[warn] Error parsing Icecast HTML: {e}")
+        mounts[mount] = {
+            "mountpoint": mount,
+            "listeners": listeners,
+            "listener_peak": peak,
+            "title": None
+        }
 
-    return result
+    return mounts
 
 def fetch_status_for_server(base_url: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -365,7 +760,7 @@ def fetch_status_for_server(base_url: Optional[str] = None) -> Dict[str, Any]:
         status = fetch_icecast_status_html(base_url)
 
     if not status:
-        status = {"mounts": {}, "fetched_at": iso_now()}
+        status = {"mounts": {}, "fetched_at": RUN_ISO}
 
     return status
 
@@ -382,7 +777,7 @@ def fetch_listener_data() -> Dict[str, Any]:
     result = {
         "towers": {},
         "total": 0,
-        "fetched_at": iso_now()
+        "fetched_at": RUN_ISO
     }
 
     # Group towers by their base URL to minimize requests
@@ -393,9 +788,17 @@ def fetch_listener_data() -> Dict[str, Any]:
             towers_by_url[base_url] = []
         towers_by_url[base_url].append((tower_id, config))
 
-    # Fetch status from each unique server
+    # Fetch each unique server concurrently: fetches are independent and
+    # I/O bound, so wall time is the slowest server, not the sum of all
+    base_urls = list(towers_by_url.keys())
+    if len(base_urls) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(base_urls))) as ex:
+            statuses = dict(zip(base_urls, ex.map(fetch_status_for_server, base_urls)))
+    else:
+        statuses = {url: fetch_status_for_server(url) for url in base_urls}
+
     for base_url, towers in towers_by_url.items():
-        status = fetch_status_for_server(base_url)
+        status = statuses[base_url]
         mounts = status.get("mounts", {})
 
         for tower_id, config in towers:
@@ -428,18 +831,94 @@ def fetch_listener_data() -> Dict[str, Any]:
 # Any timestamp before this is considered corrupted data
 MIN_VALID_TIMESTAMP_MS = 1577836800000  # 2020-01-01
 
+# A series is a sequence of (ts_ms, value) pairs — packed as an (N, 2)
+# int64 numpy array when numpy is available, a list of tuples otherwise
+SeriesMap = Dict[str, Any]
+
 def is_valid_timestamp(ts_ms: int) -> bool:
     """Check if a timestamp in milliseconds is valid (after 2020-01-01)."""
     return ts_ms >= MIN_VALID_TIMESTAMP_MS
 
 def load_history() -> List[Dict[str, Any]]:
     """Load historical data from CSV, filtering out corrupted rows."""
+    if not os.path.exists(HISTORY_CSV):
+        return []
+
+    if HAS_PANDAS:
+        try:
+            return _load_history_pandas()
+        except Exception as e:
+            print(f"[warn] pandas history load failed, falling back: {e}")
+
+    return _load_history_csv()
+
+# Validated history frame (and the row list derived from it) kept by
+# _load_history_pandas so build_series_map can emit columnar arrays
+# without re-touching rows
+_history_df = None
+_history_rows: Optional[List[Dict[str, Any]]] = None
+
+def _load_history_pandas() -> List[Dict[str, Any]]:
+    """
+    Load history via pandas' C CSV parser.
+
+    Timestamp validation and numeric coercion happen as vectorized
+    column operations rather than per-cell int() calls. The validated
+    frame is cached module-wide for build_series_map's fast path.
+    """
+    global _history_df, _history_rows
+
+    df = pd.read_csv(HISTORY_CSV, keep_default_na=False)
+    if "timestamp_ms" not in df.columns:
+        return []
+
+    ts = pd.to_numeric(df["timestamp_ms"], errors="coerce")
+    mask = ts.notna() & (ts >= MIN_VALID_TIMESTAMP_MS)
+    skipped = int(len(df) - mask.sum())
+
+    df = df.loc[mask].copy()
+    df["timestamp_ms"] = ts.loc[mask].astype("int64")
+
+    # Coerce value columns, salvaging the numeric cells of mixed columns
+    # (a column added mid-history is backfilled with "" by the header
+    # rewrite — the valid tail must still chart). Fully-numeric columns
+    # stay plain int64; mixed ones become nullable Int64 with holes.
+    mixed_cols: List[str] = []
+    for col in df.columns:
+        if col in ("timestamp_iso", "timestamp_ms"):
+            continue
+        vals = pd.to_numeric(df[col], errors="coerce")
+        if not vals.isna().any():
+            df[col] = vals.astype("int64")
+        elif vals.notna().any():
+            try:
+                df[col] = vals.astype("Int64")
+                mixed_cols.append(col)
+            except (TypeError, ValueError):
+                pass  # Non-integral values; leave the column as-is
+
+    if skipped > 0:
+        print(f"[info] Skipped {skipped} corrupted rows from history.csv")
+
+    _history_df = df
+    _history_rows = df.to_dict("records")
+
+    # Match the stdlib loader's per-cell salvage: cells that failed
+    # coercion come back as "" — the backfill value — so build_series_map
+    # skips them and archives serialize them like the stdlib path
+    if mixed_cols:
+        for row in _history_rows:
+            for col in mixed_cols:
+                if row[col] is pd.NA:
+                    row[col] = ""
+
+    return _history_rows
+
+def _load_history_csv() -> List[Dict[str, Any]]:
+    """Row-by-row stdlib csv loader (fallback when pandas is missing)."""
     rows: List[Dict[str, Any]] = []
     skipped = 0
 
-    if not os.path.exists(HISTORY_CSV):
-        return rows
-
     try:
         with open(HISTORY_CSV, "r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
@@ -477,7 +956,7 @@ def load_history() -> List[Dict[str, Any]]:
     return rows
 
 def save_history(rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
-    """Save historical data to CSV."""
+    """Rewrite the full history CSV (only needed when fieldnames change)."""
     try:
         with open(HISTORY_CSV, "w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -487,45 +966,167 @@ def save_history(rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
     except Exception as e:
         print(f"[error] Failed to save history: {e}")
 
-def build_series_map(rows: List[Dict[str, Any]], names: List[str]) -> Dict[str, List[Tuple[int, int]]]:
-    """Build time series map from rows, filtering out corrupted timestamps."""
+def history_header_matches(fieldnames: List[str]) -> bool:
+    """
+    Check the on-disk CSV header against the expected fieldnames.
+
+    A mismatch (e.g. a tower was added or relabeled) means appending
+    would misalign columns and the caller must do a one-time rewrite.
+    A missing or empty file counts as a match: append writes the header.
+    """
+    try:
+        with open(HISTORY_CSV, "r", newline="", encoding="utf-8") as f:
+            header = f.readline().strip()
+    except OSError:
+        return True
+    if not header:
+        return True
+    return header.split(",") == fieldnames
+
+def append_history(record: Dict[str, Any], fieldnames: List[str]) -> None:
+    """
+    Append a single record to the history CSV.
+
+    One row is added per tick, so appending is O(1) per run instead of
+    rewriting the whole file — which also spares the Pi's SD card.
+    The header is only written when the file is new or empty.
+    """
+    try:
+        write_header = (not os.path.exists(HISTORY_CSV)
+                        or os.path.getsize(HISTORY_CSV) == 0)
+        with open(HISTORY_CSV, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(fieldnames)
+            writer.writerow([record.get(name, "") for name in fieldnames])
+    except Exception as e:
+        print(f"[error] Failed to append history: {e}")
+
+def build_series_map(rows: List[Dict[str, Any]], names: List[str]) -> SeriesMap:
+    """
+    Build time series map from rows, filtering out corrupted timestamps.
+
+    Rows are already numerically coerced by load_history, so this is a
+    single pass: per-series append methods are bound to locals once and
+    cells that failed coercion upstream (still strings) are skipped
+    without any per-cell int()/try-except.
+
+    With numpy available, each series is packed into an (N, 2) int64
+    array — far smaller than tuples and filterable with a single mask.
+
+    When the rows came straight out of the pandas loader this tick, the
+    arrays are built columnar from the cached frame instead of looping
+    the row dicts at all.
+    """
+    # Identity check: only the loader's own list (plus rows appended to
+    # it afterwards) maps onto the cached frame — subsets never do
+    if HAS_PANDAS and _history_df is not None and rows is _history_rows:
+        return _series_map_from_df(_history_df, names, rows[len(_history_df):])
+
     series_map: Dict[str, List[Tuple[int, int]]] = {name: [] for name in names}
+    appenders = [(name, series_map[name].append) for name in names]
+    min_valid = MIN_VALID_TIMESTAMP_MS
 
     for row in rows:
-        try:
-            ts = int(row.get("timestamp_ms", 0))
-        except (ValueError, TypeError):
-            continue  # Skip rows with invalid timestamp_ms
+        ts = row.get("timestamp_ms")
+        if ts is None or isinstance(ts, str) or ts < min_valid:
+            continue  # Missing, uncoerced, or corrupted timestamp
 
-        # Skip corrupted timestamps (before 2020)
-        if not is_valid_timestamp(ts):
-            continue
+        get = row.get
+        for name, append in appenders:
+            v = get(name)
+            if v is not None and not isinstance(v, str):
+                append((ts, v))
 
-        for name in names:
-            if name in row:
-                try:
-                    series_map[name].append((ts, int(row[name])))
-                except (ValueError, TypeError):
-                    pass
+    if HAS_NUMPY:
+        return {
+            name: np.asarray(pts, dtype=np.int64).reshape(-1, 2)
+            for name, pts in series_map.items()
+        }
 
     return series_map
 
-def filter_series_by_year(series_map: Dict[str, List[Tuple[int, int]]], cutoff_year: int) -> Dict[str, List[Tuple[int, int]]]:
-    """Filter series to only include data from cutoff year and later."""
-    filtered: Dict[str, List[Tuple[int, int]]] = {k: [] for k in series_map}
+def _series_map_from_df(df, names: List[str], extra_rows: List[Dict[str, Any]]) -> SeriesMap:
+    """
+    Columnar fast path for build_series_map: zip the frame's int64
+    timestamp/value columns directly into packed arrays, then tack on
+    any rows appended after the load (this tick's record).
+    """
+    ts = df["timestamp_ms"].to_numpy(dtype=np.int64, copy=False)
+    series_map: SeriesMap = {}
+
+    for name in names:
+        if name in df.columns and df[name].dtype.kind in "iu":
+            col = df[name]
+            mask = col.notna().to_numpy()
+            if mask.all():
+                arr = np.column_stack((ts, col.to_numpy(dtype=np.int64, copy=False)))
+            else:
+                # Mixed column (nullable Int64): chart only the valid cells
+                arr = np.column_stack(
+                    (ts[mask], col.dropna().to_numpy(dtype=np.int64))
+                )
+        else:
+            arr = np.empty((0, 2), dtype=np.int64)
+
+        for row in extra_rows:
+            v = row.get(name)
+            if v is not None and not isinstance(v, str):
+                arr = np.vstack((arr, np.array([[row["timestamp_ms"], v]], dtype=np.int64)))
+
+        series_map[name] = arr
 
-    for name, pts in series_map.items():
-        for (ts, val) in pts:
-            year = datetime.fromtimestamp(ts / 1000.0, tz=timezone.utc).year
-            if year >= cutoff_year:
-                filtered[name].append((ts, val))
+    return series_map
 
-    return filtered
+def points_since(pts: Any, cutoff_ms: int) -> Any:
+    """
+    Return the points at or after cutoff_ms.
 
-def write_json_outputs(series_map: Dict[str, List[Tuple[int, int]]]) -> None:
-    """Write data_24h.json and data_all.json."""
+    History rows are appended in time order, so per-series timestamps
+    are sorted: the cut is a binary search plus a tail slice (a view,
+    for arrays) instead of a full scan.
+    """
+    if HAS_NUMPY and isinstance(pts, np.ndarray):
+        i = int(np.searchsorted(pts[:, 0], cutoff_ms, side="left"))
+        return pts[i:]
+    # A 1-tuple sorts before every (cutoff_ms, value) point, so plain
+    # tuple comparison finds the cut without bisect's 3.10+ key= arg
+    i = bisect_left(pts, (cutoff_ms,))
+    return pts[i:]
+
+def filter_series_by_year(series_map: SeriesMap, cutoff_year: int) -> SeriesMap:
+    """Filter series to only include data from cutoff year and later."""
+    # Timestamps are UTC epoch ms, so "year >= cutoff" is a plain integer
+    # comparison against the cutoff year's start — no per-point datetime.
+    cutoff_ms = int(datetime(cutoff_year, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    return {
+        name: points_since(pts, cutoff_ms)
+        for name, pts in series_map.items()
+    }
+
+def series_fingerprint(series_map: SeriesMap) -> str:
+    """
+    Cheap fingerprint of a series map: per-series name, point count and
+    last timestamp. History is append-only, so this changes exactly when
+    the serialized output would.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(series_map):
+        pts = series_map[name]
+        h.update(name.encode("utf-8"))
+        h.update(str(len(pts)).encode())
+        if len(pts):
+            h.update(str(pts[-1][0]).encode())
+    return h.hexdigest()
+
+def write_json_outputs(series_map: SeriesMap, now_iso: str, now_ms: int) -> List[str]:
+    """
+    Write data_24h.json and data_all.json.
+
+    Returns the paths actually rewritten this run.
+    """
     os.makedirs(SITE_DATA_DIR, exist_ok=True)
-    now_iso = iso_now()
+    changed: List[str] = []
 
     # Optionally filter for data_all
     series_map_for_all = series_map
@@ -536,26 +1137,41 @@ def write_json_outputs(series_map: Dict[str, List[Tuple[int, int]]]) -> None:
         except ValueError:
             pass
 
-    # data_all.json
-    payload_all = {
-        "generated_at": now_iso,
-        "series": [{"name": name, "points": pts} for name, pts in series_map_for_all.items()]
-    }
-    with open(os.path.join(SITE_DATA_DIR, "data_all.json"), "w", encoding="utf-8") as f:
-        json.dump(payload_all, f, ensure_ascii=False)
+    # data_all.json — skip the O(N) re-encode when nothing new landed in it
+    fingerprint = series_fingerprint(series_map_for_all)
+    old_fingerprint = None
+    try:
+        with open(DATA_ALL_STAMP, "r", encoding="utf-8") as f:
+            old_fingerprint = f.read().strip()
+    except OSError:
+        pass
+
+    if fingerprint != old_fingerprint:
+        payload_all = {
+            "generated_at": now_iso,
+            "series": [{"name": name, "points": pts} for name, pts in series_map_for_all.items()]
+        }
+        data_all_path = os.path.join(SITE_DATA_DIR, "data_all.json")
+        if write_if_changed(data_all_path, json_dumps_bytes(payload_all)):
+            changed.append(data_all_path)
+        with open(DATA_ALL_STAMP, "w", encoding="utf-8") as f:
+            f.write(fingerprint)
 
     # data_24h.json
-    cutoff_ms = int((datetime.now(timezone.utc) - timedelta(hours=WINDOW_HOURS)).timestamp() * 1000)
+    cutoff_ms = now_ms - WINDOW_HOURS * 3600 * 1000
     clipped = {
-        name: [(ts, val) for (ts, val) in pts if ts >= cutoff_ms]
+        name: points_since(pts, cutoff_ms)
         for name, pts in series_map.items()
     }
     payload_24h = {
         "generated_at": now_iso,
         "series": [{"name": name, "points": pts} for name, pts in clipped.items()]
     }
-    with open(os.path.join(SITE_DATA_DIR, "data_24h.json"), "w", encoding="utf-8") as f:
-        json.dump(payload_24h, f, ensure_ascii=False)
+    data_24h_path = os.path.join(SITE_DATA_DIR, "data_24h.json")
+    if write_if_changed(data_24h_path, json_dumps_bytes(payload_24h)):
+        changed.append(data_24h_path)
+
+    return changed
 
 def row_year(row: Dict[str, Any]) -> int:
     """Get year from a history row."""
@@ -568,8 +1184,21 @@ def row_year(row: Dict[str, Any]) -> int:
         except:
             return datetime.now(timezone.utc).year
 
-def write_archives(rows: List[Dict[str, Any]], names: List[str]) -> None:
-    """Write monthly and yearly archive files."""
+def write_archives(rows: List[Dict[str, Any]], names: List[str],
+                   now_iso: str, only: Optional[set] = None) -> List[str]:
+    """
+    Write monthly and yearly archive files.
+
+    Args:
+        now_iso: the run's shared generated_at timestamp.
+        only: optional set of (year, month_key) pairs. When given, only
+            archives covering those keys are rewritten. Past months/years
+            never change between runs, so the per-tick caller passes just
+            the current pair instead of re-serializing the whole history.
+
+    Returns the paths actually rewritten this run.
+    """
+    changed: List[str] = []
     os.makedirs(ARCHIVE_MONTHLY_DIR, exist_ok=True)
     os.makedirs(ARCHIVE_YEARLY_DIR, exist_ok=True)
 
@@ -578,26 +1207,55 @@ def write_archives(rows: List[Dict[str, Any]], names: List[str]) -> None:
     years_set = set()
     months_set = set()
 
-    for row in rows:
-        # Validate timestamp before processing
-        try:
-            ts_ms = int(row.get("timestamp_ms", 0))
-        except (ValueError, TypeError):
-            continue  # Skip rows with invalid timestamp_ms
+    # Rows are time-ordered, so when only current periods are requested
+    # the bucketing loop can start at the earliest requested year instead
+    # of walking all of history (the index files merge, so past keys are
+    # never lost by scanning just the tail)
+    if only is not None and rows:
+        start_year = min(y for (y, _m) in only)
+        period_start_ms = int(datetime(start_year, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+        rows = rows[_bisect_rows_by_ts(rows, period_start_ms):]
+
+    if HAS_NUMPY and rows:
+        # Vectorized calendar math: epoch ms -> 'YYYY-MM' keys in one
+        # datetime64 cast instead of a datetime object per row
+        ts_arr = np.asarray([_row_ts_ms(r) for r in rows], dtype=np.int64)
+        month_keys = ts_arr.astype("datetime64[ms]").astype("datetime64[M]").astype(str)
+        for row, ts_ms, month_key in zip(rows, ts_arr.tolist(), month_keys.tolist()):
+            if not is_valid_timestamp(ts_ms):
+                continue  # Skip corrupted timestamps (before 2020)
+
+            year = int(month_key[:4])
+            by_year.setdefault(year, []).append(row)
+            by_month.setdefault(month_key, []).append(row)
+            years_set.add(year)
+            months_set.add(month_key)
+    else:
+        for row in rows:
+            # Validate timestamp before processing
+            try:
+                ts_ms = int(row.get("timestamp_ms", 0))
+            except (ValueError, TypeError):
+                continue  # Skip rows with invalid timestamp_ms
 
-        if not is_valid_timestamp(ts_ms):
-            continue  # Skip corrupted timestamps (before 2020)
+            if not is_valid_timestamp(ts_ms):
+                continue  # Skip corrupted timestamps (before 2020)
 
-        year = row_year(row)
-        dt = datetime.fromtimestamp(ts_ms / 1000.0, tz=timezone.utc)
-        month_key = f"{dt.year:04d}-{dt.month:02d}"
+            year = row_year(row)
+            dt = datetime.fromtimestamp(ts_ms / 1000.0, tz=timezone.utc)
+            month_key = f"{dt.year:04d}-{dt.month:02d}"
 
-        by_year.setdefault(year, []).append(row)
-        by_month.setdefault(month_key, []).append(row)
-        years_set.add(year)
-        months_set.add(month_key)
+            by_year.setdefault(year, []).append(row)
+            by_month.setdefault(month_key, []).append(row)
+            years_set.add(year)
+            months_set.add(month_key)
 
-    now_iso = iso_now()
+    # Restrict to the requested keys (indexes still cover everything)
+    if only is not None:
+        only_years = {y for (y, _m) in only}
+        only_months = {m for (_y, m) in only}
+        by_year = {y: r for y, r in by_year.items() if y in only_years}
+        by_month = {m: r for m, r in by_month.items() if m in only_months}
 
     # Write yearly archives
     for year, year_rows in by_year.items():
@@ -607,8 +1265,9 @@ def write_archives(rows: List[Dict[str, Any]], names: List[str]) -> None:
             "series": [{"name": n, "points": pts} for n, pts in series_map.items()]
         }
         try:
-            with open(os.path.join(ARCHIVE_YEARLY_DIR, f"{year}.json"), "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False)
+            path = os.path.join(ARCHIVE_YEARLY_DIR, f"{year}.json")
+            if write_if_changed(path, json_dumps_bytes(payload)):
+                changed.append(path)
         except Exception as e:
             print(f"[warn] Failed to write yearly archive {year}: {e}")
 
@@ -620,26 +1279,87 @@ def write_archives(rows: List[Dict[str, Any]], names: List[str]) -> None:
             "series": [{"name": n, "points": pts} for n, pts in series_map.items()]
         }
         try:
-            with open(os.path.join(ARCHIVE_MONTHLY_DIR, f"{month_key}.json"), "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False)
+            path = os.path.join(ARCHIVE_MONTHLY_DIR, f"{month_key}.json")
+            if write_if_changed(path, json_dumps_bytes(payload)):
+                changed.append(path)
         except Exception as e:
             print(f"[warn] Failed to write monthly archive {month_key}: {e}")
 
-    # Write indexes
+    # Write indexes (skipped when the key sets haven't changed)
     try:
-        with open(os.path.join(SITE_DATA_DIR, "yearly_index.json"), "w", encoding="utf-8") as f:
-            json.dump({"years": sorted(list(years_set))}, f, ensure_ascii=False)
-        with open(os.path.join(SITE_DATA_DIR, "monthly_index.json"), "w", encoding="utf-8") as f:
-            json.dump({"months": sorted(list(months_set))}, f, ensure_ascii=False)
+        for path, key, values in (
+            (os.path.join(SITE_DATA_DIR, "yearly_index.json"), "years", years_set),
+            (os.path.join(SITE_DATA_DIR, "monthly_index.json"), "months", months_set),
+        ):
+            if write_index_if_changed(path, key, values):
+                changed.append(path)
     except Exception as e:
         print(f"[warn] Failed to write archive indexes: {e}")
 
-def write_pi_health() -> None:
-    """Collect and write Pi health telemetry."""
+    return changed
+
+def _row_ts_ms(row: Dict[str, Any]) -> int:
+    """Sort/bisect key: a row's timestamp_ms, 0 when missing/uncoerced."""
+    ts = row.get("timestamp_ms", 0)
+    return ts if not isinstance(ts, str) else 0
+
+def _bisect_rows_by_ts(rows: List[Dict[str, Any]], cutoff_ms: int) -> int:
+    """
+    Index of the first row with timestamp_ms >= cutoff_ms.
+
+    Hand-rolled binary search because bisect's key= argument needs
+    Python 3.10; this runs on whatever interpreter the Pi ships.
+    """
+    lo, hi = 0, len(rows)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _row_ts_ms(rows[mid]) < cutoff_ms:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def write_index_if_changed(path: str, key: str, values: set) -> bool:
+    """
+    Merge values into an archive index file, writing only when it grows.
+
+    Merging (rather than replacing) lets callers report just the keys
+    they scanned this run — archives are never deleted, so index keys
+    only ever accumulate.
+    """
+    existing: List[Any] = []
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                existing = json_loads_bytes(f.read()).get(key) or []
+        except Exception:
+            pass  # Unreadable/corrupt index: rewrite it
+
+    merged = sorted(set(existing) | set(values))
+    if merged == existing:
+        return False
+
+    atomic_write_bytes(path, json_dumps_bytes({key: merged}))
+    return True
+
+def _read_small_file(path: str) -> bytes:
+    """Read a tiny procfs/sysfs file via raw os calls (no buffer layer)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 65536)
+    finally:
+        os.close(fd)
+
+def write_pi_health(now_iso: str) -> List[str]:
+    """
+    Collect and write Pi health telemetry.
+
+    Returns the paths actually rewritten this run.
+    """
     os.makedirs(SITE_DATA_DIR, exist_ok=True)
 
     payload = {
-        "timestamp_iso": iso_now(),
+        "timestamp_iso": now_iso,
         "temp_c": None,
         "disk_total_gb": None,
         "disk_used_gb": None,
@@ -652,12 +1372,12 @@ def write_pi_health() -> None:
     try:
         # Temperature
         try:
-            with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-                payload["temp_c"] = round(int(f.read().strip()) / 1000.0, 2)
+            raw = _read_small_file("/sys/class/thermal/thermal_zone0/temp")
+            payload["temp_c"] = round(int(raw.strip()) / 1000.0, 2)
         except Exception:
             try:
                 out = subprocess.check_output(["vcgencmd", "measure_temp"], text=True).strip()
-                match = re.search(r"temp=([0-9.]+)", out)
+                match = _RE_TEMP.search(out)
                 if match:
                     payload["temp_c"] = float(match.group(1))
             except Exception:
@@ -672,16 +1392,15 @@ def write_pi_health() -> None:
         except Exception:
             pass
 
-        # Memory
+        # Memory — both fields picked up in one scan of the buffer
         try:
-            with open("/proc/meminfo", "r") as f:
-                data = f.read()
-            mt = re.search(r"MemTotal:\s+(\d+) kB", data)
-            ma = re.search(r"MemAvailable:\s+(\d+) kB", data)
-            if mt:
-                payload["mem_total_mb"] = round(int(mt.group(1)) / 1024.0, 1)
-            if ma:
-                payload["mem_available_mb"] = round(int(ma.group(1)) / 1024.0, 1)
+            data = _read_small_file("/proc/meminfo")
+            for m in _RE_MEMINFO.finditer(data):
+                val_mb = round(int(m.group(2)) / 1024.0, 1)
+                if m.group(1) == b"MemTotal":
+                    payload["mem_total_mb"] = val_mb
+                else:
+                    payload["mem_available_mb"] = val_mb
         except Exception:
             pass
 
@@ -696,38 +1415,91 @@ def write_pi_health() -> None:
         except Exception:
             pass
 
-        with open(os.path.join(SITE_DATA_DIR, "pi_health.json"), "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False)
+        path = os.path.join(SITE_DATA_DIR, "pi_health.json")
+        if write_if_changed(path, json_dumps_bytes(payload)):
+            return [path]
 
     except Exception as e:
         print(f"[warn] Failed to write pi_health.json: {e}")
 
+    return []
+
+def _push_due() -> bool:
+    """Whether enough time has passed since the last successful push."""
+    if PUSH_INTERVAL_MS <= 0:
+        return True
+    try:
+        with open(PUSH_STAMP_PATH, "r", encoding="utf-8") as f:
+            last_push_ms = int(f.read().strip())
+    except (OSError, ValueError):
+        return True
+    return RUN_MS - last_push_ms >= PUSH_INTERVAL_MS
+
 def git_commit_and_push(files: List[str], message: str) -> None:
-    """Commit and push changes to git."""
+    """
+    Commit changes to git, pushing at most once per PUSH_INTERVAL_MINUTES.
+
+    A porcelain status check runs first: only the candidate paths git
+    itself reports dirty get staged, and when none are dirty the whole
+    add/commit/push pipeline is skipped. The pipeline itself is one
+    shell invocation — a single subprocess round-trip from Python, with
+    each stage gated on the previous one succeeding. When the push
+    interval has not elapsed the pipeline stops after the commit; the
+    next due push carries every commit accumulated since the last one.
+    """
+    dirty = files
     try:
-        subprocess.run(["git", "-C", REPO_ROOT, "add"] + files, check=True)
-        subprocess.run(["git", "-C", REPO_ROOT, "commit", "-m", message], check=True)
-        subprocess.run(["git", "-C", REPO_ROOT, "push"], check=True)
+        porcelain = subprocess.check_output(
+            ["git", "-C", REPO_ROOT, "status", "--porcelain=v1", "-z", "--"] + files
+        )
+        entries = [e for e in porcelain.split(b"\x00") if len(e) > 3]
+        if not entries:
+            print("[info] No file changes for git; skipping commit/push")
+            return
+        dirty = [e[3:].decode("utf-8", "replace") for e in entries]
+    except (subprocess.CalledProcessError, OSError):
+        pass  # Status probe failed; stage the full candidate list
+
+    push = _push_due()
+    git = f"git -C {shlex.quote(REPO_ROOT)}"
+    cmd = (
+        f"{git} add -- {' '.join(shlex.quote(f) for f in dirty)}"
+        f" && {git} commit -m {shlex.quote(message)}"
+    )
+    if push:
+        cmd += f" && {git} push"
+    else:
+        print("[info] Push interval not reached; committed locally only")
+    try:
+        subprocess.run(cmd, shell=True, check=True)
+        if push:
+            atomic_write_bytes(PUSH_STAMP_PATH, str(RUN_MS).encode("ascii"))
     except subprocess.CalledProcessError as e:
         print(f"[warn] Git operation failed: {e}")
 
 # --------------------------- Main ---------------------------
 
 def main():
-    print(f"[{iso_now()}] Starting scrape...")
+    # One clock read per run (see RUN_DT): every record and output file
+    # shares the same timestamp
+    now_dt = RUN_DT
+    now_iso = RUN_ISO
+    now_ms = RUN_MS
+
+    print(f"[{now_iso}] Starting scrape...")
 
     # Fetch current listener data
     data = fetch_listener_data()
+    save_etag_cache()
 
     print(f"[info] Fetched: {data['total']} total listeners")
     for tower_id, tower in data["towers"].items():
         print(f"  {tower['label']}: {tower['listeners']} (peak: {tower['listener_peak']})")
 
     # Build record for history
-    ts_ms = ts_now_ms()
     record = {
-        "timestamp_iso": iso_now(),
-        "timestamp_ms": ts_ms
+        "timestamp_iso": now_iso,
+        "timestamp_ms": now_ms
     }
 
     # Add listener counts (only tracked towers)
@@ -742,53 +1514,56 @@ def main():
     names = [t["label"] for t in data["towers"].values() if t["include_in_history"]] + ["Total"]
     fieldnames = ["timestamp_iso", "timestamp_ms"] + names
 
-    rows.append(record)
-    save_history(rows, fieldnames)
+    # An identical, recent last row carries no new information — skip the
+    # append (and the git churn below) and just refresh the sliding views.
+    # The heartbeat cap still guarantees at least one row per hour.
+    unchanged = False
+    if rows:
+        last = rows[-1]
+        last_ts = last.get("timestamp_ms")
+        unchanged = (
+            isinstance(last_ts, int)
+            and (now_ms - last_ts) < HEARTBEAT_INTERVAL_MS
+            and last.get("Total") == data["total"]
+            and all(last.get(t["label"]) == t["listeners"]
+                    for t in data["towers"].values() if t["include_in_history"])
+        )
 
-    # Build series map and write outputs
+    if unchanged:
+        print("[info] Listener counts unchanged; skipping history append")
+    else:
+        rows.append(record)
+        if history_header_matches(fieldnames):
+            append_history(record, fieldnames)
+        else:
+            # Column set changed — one-time full rewrite keeps the CSV square
+            print("[info] History columns changed; rewriting history.csv")
+            save_history(rows, fieldnames)
+
+    # Build series map and write outputs, tracking what actually changed
     series_map = build_series_map(rows, names)
-    write_json_outputs(series_map)
-    write_archives(rows, names)
+    changed_files = write_json_outputs(series_map, now_iso, now_ms)
+
+    # Only the archives covering "now" can have changed this tick
+    current_month_key = f"{now_dt.year:04d}-{now_dt.month:02d}"
+    changed_files += write_archives(rows, names, now_iso,
+                                    only={(now_dt.year, current_month_key)})
 
     # Pi health
     if ENABLE_PI_HEALTH:
-        write_pi_health()
-
-    # Git commit/push
-    if not SKIP_GIT:
-        files_to_commit = [
-            os.path.relpath(os.path.join(SITE_DATA_DIR, "data_all.json"), REPO_ROOT),
-            os.path.relpath(os.path.join(SITE_DATA_DIR, "data_24h.json"), REPO_ROOT),
-            os.path.relpath(HISTORY_CSV, REPO_ROOT),
-            os.path.relpath(os.path.join(SITE_DATA_DIR, "monthly_index.json"), REPO_ROOT),
-            os.path.relpath(os.path.join(SITE_DATA_DIR, "yearly_index.json"), REPO_ROOT),
-        ]
-
-        if ENABLE_PI_HEALTH:
-            files_to_commit.append(
-                os.path.relpath(os.path.join(SITE_DATA_DIR, "pi_health.json"), REPO_ROOT)
-            )
-
-        # Add archive files
-        try:
-            for fname in os.listdir(ARCHIVE_MONTHLY_DIR):
-                if fname.endswith('.json'):
-                    files_to_commit.append(
-                        os.path.relpath(os.path.join(ARCHIVE_MONTHLY_DIR, fname), REPO_ROOT)
-                    )
-        except Exception:
-            pass
+        changed_files += write_pi_health(now_iso)
 
-        try:
-            for fname in os.listdir(ARCHIVE_YEARLY_DIR):
-                if fname.endswith('.json'):
-                    files_to_commit.append(
-                        os.path.relpath(os.path.join(ARCHIVE_YEARLY_DIR, fname), REPO_ROOT)
-                    )
-        except Exception:
-            pass
+    # All renames done — make them durable with one fsync per directory
+    flush_write_dirs()
 
+    # Git commit/push — only files whose bytes changed this run, and no
+    # git subprocesses at all when there is nothing to commit
+    if not SKIP_GIT and not unchanged:
+        files_to_commit = [os.path.relpath(HISTORY_CSV, REPO_ROOT)]
+        files_to_commit += [os.path.relpath(p, REPO_ROOT) for p in changed_files]
         git_commit_and_push(files_to_commit, f"Update listener data @ {record['timestamp_iso']}")
+    elif changed_files:
+        print(f"[info] {len(changed_files)} file(s) refreshed, push skipped")
 
     print(f"[{iso_now()}] Scrape complete!")
 